@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-from typing import Optional, Tuple, TYPE_CHECKING, override
+from typing import Sequence, TYPE_CHECKING, override
 
 import colour
 
 if TYPE_CHECKING:
     from engine import Engine
-    from entity import Actor, Entity
+    from entity import Actor
+    from game_map import GameMap
 
 
 class Action:
@@ -86,33 +87,88 @@ class ActionWithDirection(Action):
         self.dx = dx
         self.dy = dy
 
-    @property
-    def dest_xy(self) -> Tuple[int, int]:
-        """
-        Return the destination x, y coordinates.
-        """
-        return self.entity.x + self.dx, self.entity.y + self.dy
-
-    @property
-    def blocking_entity(self) -> Optional[Entity]:
-        """
-        Return the blocking entity at the destination.
-        """
-        return self.engine.game_map.get_blocking_entity_at_location(
-            *self.dest_xy)
-
-    @property
-    def target_actor(self) -> Optional[Actor]:
-        """
-        Return the actor at the destination.
-        """
-        return self.engine.game_map.get_actor_at_location(*self.dest_xy)
-
     @override
     def perform(self) -> None:
         raise NotImplementedError()
 
 
+def perform_melee(
+        engine: Engine,
+        attackers: Sequence[Actor],
+        target: Actor,
+) -> None:
+    """
+    Have one or more entities attack a target actor.
+
+    The attacks are resolved together, with their damage summed and applied
+    to the target in one go, and a single message for the whole group.
+
+    Args:
+        engine: The engine the attack takes place in.
+        attackers: The entities performing the attack.
+        target: The actor being attacked.
+    """
+    defense = target.fighter.defense
+    damage = sum(
+        max(0, attacker.fighter.power - defense) for attacker in attackers
+    )
+
+    names = [attacker.name for attacker in attackers]
+    names[0] = names[0].capitalize()
+    if len(names) == 1:
+        attack_desc = f"{names[0]} attacks {target.name}"
+        no_damage = "does no damage"
+    else:
+        attack_desc = (
+            f"{', '.join(names[:-1])} and {names[-1]} attack {target.name}"
+        )
+        no_damage = "do no damage"
+
+    if attackers[0] is engine.player:
+        attack_colour = colour.player_atk
+    else:
+        attack_colour = colour.enemy_atk
+
+    if damage > 0:
+        engine.message_log.add_message(
+            f"{attack_desc} for {damage} hit points.",
+            attack_colour
+        )
+        target.fighter.hp -= damage
+    else:
+        engine.message_log.add_message(
+            f"{attack_desc} but {no_damage}.",
+            attack_colour
+        )
+
+
+def perform_movement(
+        game_map: GameMap,
+        entity: Actor,
+        dx: int,
+        dy: int,
+) -> None:
+    """
+    Move an entity by one step, unless the destination is blocked.
+
+    Args:
+        game_map: The game map the entity is moving on.
+        entity: The entity to move.
+        dx: The amount to move in the x-direction.
+        dy: The amount to move in the y-direction.
+    """
+    dest_x, dest_y = entity.x + dx, entity.y + dy
+
+    # Movement is at most one tile, so the border of the padded array covers
+    # the bounds check
+    if not game_map.walkable_padded[dest_x + 1, dest_y + 1]:
+        return  # Destination is out of bounds or blocked by a tile.
+    if game_map.get_blocking_entity_at_location(dest_x, dest_y):
+        return  # Destination is blocked by an entity.
+
+    entity.move(dx, dy)
+
+
 class MeleeAction(ActionWithDirection):
     """
     An action to perform a melee attack.
@@ -122,29 +178,13 @@ class MeleeAction(ActionWithDirection):
         """
         Perform the melee action.
         """
-        target = self.target_actor
+        engine = self.engine
+        target = engine.game_map.get_actor_at_location(
+            self.entity.x + self.dx, self.entity.y + self.dy)
         if not target:
             return  # No entity to attack.
 
-        damage = self.entity.fighter.power - target.fighter.defense
-
-        attack_desc = f"{self.entity.name.capitalize()} attacks {target.name}"
-        if self.entity is self.engine.player:
-            attack_colour = colour.player_atk
-        else:
-            attack_colour = colour.enemy_atk
-
-        if damage > 0:
-            self.engine.message_log.add_message(
-                f"{attack_desc} for {damage} hit points.",
-                attack_colour
-            )
-            target.fighter.hp -= damage
-        else:
-            self.engine.message_log.add_message(
-                f"{attack_desc} but does no damage.",
-                attack_colour
-            )
+        perform_melee(engine, (self.entity,), target)
 
 
 class MovementAction(ActionWithDirection):
@@ -160,16 +200,8 @@ class MovementAction(ActionWithDirection):
         """
         Perform the movement action.
         """
-        dest_x, dest_y = self.dest_xy
-
-        if not self.engine.game_map.in_bounds(dest_x, dest_y):
-            return  # Destination is out of bounds.
-        if not self.engine.game_map.tiles["walkable"][dest_x, dest_y]:
-            return  # Destination is blocked by a tile.
-        if self.engine.game_map.get_blocking_entity_at_location(dest_x, dest_y):
-            return  # Destination is blocked by an entity.
-
-        self.entity.move(self.dx, self.dy)
+        perform_movement(
+            self.engine.game_map, self.entity, self.dx, self.dy)
 
 
 class BumpAction(ActionWithDirection):
@@ -180,8 +212,16 @@ class BumpAction(ActionWithDirection):
     def perform(self) -> None:
         """
         Determine whether to perform a melee attack or movement.
+
+        The attack or movement is carried out directly, without building a
+        separate MeleeAction or MovementAction.
         """
-        if self.target_actor:
-            return MeleeAction(self.entity, self.dx, self.dy).perform()
+        engine = self.engine
+        target = engine.game_map.get_actor_at_location(
+            self.entity.x + self.dx, self.entity.y + self.dy)
+
+        if target:
+            return perform_melee(engine, (self.entity,), target)
         else:
-            return MovementAction(self.entity, self.dx, self.dy).perform()
+            return perform_movement(
+                engine.game_map, self.entity, self.dx, self.dy)
@@ -1,11 +1,10 @@
 from __future__ import annotations
 
-from typing import List, Tuple, TYPE_CHECKING
+from typing import TYPE_CHECKING
 
 import numpy as np  # type: ignore
-import tcod
 
-from actions import Action, MeleeAction, MovementAction, WaitAction
+from actions import Action, perform_movement
 from components.base_component import BaseComponent
 
 if TYPE_CHECKING:
@@ -15,91 +14,91 @@ if TYPE_CHECKING:
 class BaseAI(Action, BaseComponent):
     """
     Base class for AI components.
+
+    Attributes:
+        path: Array of coordinates representing the path to the target,
+            stored as int16 as map coordinates are small
+        path_index: Index of the next step to take along `path`
     """
-    entity: Actor
+    __slots__ = ("path", "path_index")
 
-    def perform(self) -> None:
-        # No implementation as the engine will handle the AI's actions
-        raise NotImplementedError()
+    entity: Actor
 
-    def get_path_to(self, dest_x: int, dest_y: int) -> List[Tuple[int, int]]:
+    def __init__(self, entity: Actor):
         """
-        Compute and return a path to the target position.
-
-        If there is no valid path then return an empty list.
+        Initialize the AI component.
 
         Args:
-            dest_x: Destination x-coordinate
-            dest_y: Destination y-coordinate
-
-        Returns:
-            List of coordinates representing the path
+            entity: Actor entity
         """
-        cost = np.array(self.entity.game_map.tiles["walkable"], dtype=np.int8)
+        super().__init__(entity)
+        self.path: np.ndarray = np.empty((0, 2), dtype=np.int16)
+        self.path_index = 0
 
-        for entity in self.engine.game_map.entities:
-            if entity.blocks_movement and cost[entity.x, entity.y]:
-                # Add to the cost of a blocked position
-                # A lower number means more enemies will crowd behind each
-                # other in hallways. a higher number means enemies will take
-                # longer paths in order to surround the player
-                cost[entity.x, entity.y] += 10
+    @property
+    def has_path(self) -> bool:
+        """
+        Return whether there are steps left along the current path.
+        """
+        return self.path_index < len(self.path)
 
-        # Create a graph from the cost array and pass that graph to the new
-        # pathfinder
-        graph = tcod.path.SimpleGraph(cost=cost, cardinal=2, diagonal=3)
-        pathfinder = tcod.path.Pathfinder(graph)
+    def perform(self) -> None:
+        # No implementation as the engine will handle the AI's actions
+        raise NotImplementedError()
 
-        pathfinder.add_root((self.entity.x, self.entity.y))
+    def get_path_to_player(self) -> np.ndarray:
+        """
+        Compute and return a path to the player.
 
-        # Compute the path to the destination and remove the starting point
-        path: List[List[int]] = (
-            pathfinder.path_to((dest_x, dest_y))[1:].tolist())
+        Walks down the engine's shared distance map, which is rooted at the
+        player, instead of running a new search from this entity.
 
-        return [(index[0], index[1]) for index in path]
+        Returns:
+            Array of coordinates representing the path, one row per step
+        """
+        return self.engine.player_pathfinder.path_from(
+            (self.entity.x, self.entity.y))[1:].astype(np.int16)
 
 
 class HostileEnemy(BaseAI):
     """
     AI for a hostile enemy.
-
-    Attributes:
-        path: List of coordinates representing the path to the target
     """
-    def __init__(self, entity: Actor):
-        """
-        Initialize the AI component.
-
-        Args:
-            entity: Actor entity
-        """
-        super().__init__(entity)
-        self.path: List[Tuple[int, int]] = []
+    __slots__ = ()
 
     def perform(self) -> None:
         """
         Perform the hostile enemy's action.
 
         If the entity is not in the player's vision, simply wait.
-        If the player is right next to the entity (`distance <= 1`), attack
-        the player.
+        If the player is right next to the entity (`distance <= 1`), queue an
+        attack on the player, which the engine resolves along with those of
+        the other enemies at the end of the turn.
         If the player can see the entity, but the entity is too far away to
         attack, then move towards the player.
         """
-        target = self.engine.player
+        engine = self.engine
+        target = engine.player
         dx = target.x - self.entity.x
         dy = target.y - self.entity.y
         distance = max(abs(dx), abs(dy))  # Chebyshev distance
 
-        if self.engine.game_map.visible[self.entity.x, self.entity.y]:
+        if engine.game_map.visible[self.entity.x, self.entity.y]:
             if distance <= 1:
-                return MeleeAction(self.entity, dx, dy).perform()
-            self.path = self.get_path_to(target.x, target.y)
-
-        if self.path:
-            dest_x, dest_y = self.path.pop(0)
-            return MovementAction(
-                self.entity, dest_x - self.entity.x, dest_y - self.entity.y
-            ).perform()
-
-        return WaitAction(self.entity).perform()
+                engine.queue_attack(self.entity, target)
+                return
+            self.path = self.get_path_to_player()
+            self.path_index = 0
+
+        if self.has_path:
+            dest_x, dest_y = self.path[self.path_index].tolist()
+            self.path_index += 1
+            # Move directly rather than allocating a MovementAction each turn
+            return perform_movement(
+                engine.game_map,
+                self.entity,
+                dest_x - self.entity.x,
+                dest_y - self.entity.y,
+            )
+
+        # Otherwise wait, which does nothing
@@ -11,6 +11,8 @@ class BaseComponent:
     """
     Base class for components.
     """
+    __slots__ = ("entity",)
+
     entity: Entity  # The entity this component is attached to
 
     @property
@@ -21,6 +21,8 @@ class Fighter(BaseComponent):
         defense: The defense rating of the entity
         power: The power rating of the entity
     """
+    __slots__ = ("max_hp", "_hp", "defense", "power")
+
     def __init__(self, hp: int, defense: int, power: int):
         """
         Combat-related properties and methods (monster, player, NPC).
@@ -67,6 +69,7 @@ class Fighter(BaseComponent):
         else:
             death_message = f"{self.entity.name} is dead!"
             death_message_colour = colour.enemy_die
+            self.entity.game_map.remove_enemy(self.entity)
 
         self.entity.char = "%"
         self.entity.color = (191, 0, 0)
@@ -74,5 +77,6 @@ class Fighter(BaseComponent):
         self.entity.ai = None
         self.entity.name = f"remains of {self.entity.name}"
         self.entity.render_order = RenderOrder.CORPSE
+        self.entity.game_map.entity_changed(self.entity)
 
         self.engine.message_log.add_message(death_message, death_message_colour)
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
 
+import numpy as np  # type: ignore
+import tcod
 from tcod.console import Console
 from tcod.map import compute_fov
 
+from actions import perform_melee
 from input_handlers import MainGameEventHandler
 from message_log import MessageLog
 from render_functions import render_bar, render_names_at_mouse_location
@@ -22,7 +25,21 @@ class Engine:
     Responsible for drawing the map and entities, and handling input.
 
     Attributes:
+        ai_cost (Optional[np.ndarray]): The movement cost grid shared by AI
+            pathfinding, refilled whenever a new graph is needed.
+        ai_graph (Optional[tcod.path.SimpleGraph]): The pathfinding graph
+            over `ai_cost`, reused for as long as the grid is.
+        attack_queue (Dict[Actor, List[Actor]]): The attackers of each
+            target, queued by the AI during the enemy turn and resolved
+            together at its end.
         event_handler (EventHandler): The event handler.
+        fov_key (Optional[Tuple[GameMap, int, int, int]]): The map, player
+            location and tile version the FOV was last computed for.
+        fov_window (Tuple[slice, slice]): The window of the map covered by
+            the last FOV update.
+        hover_key (Optional[Tuple]): The mouse location and map state that
+            `hover_names` was last built for.
+        hover_names (str): The names of the entities under the mouse.
         message_log (MessageLog): The message log.
         mouse_location (Tuple[int, int]): The current mouse location.
         player (Actor): The player entity.
@@ -36,38 +53,169 @@ class Engine:
         Args:
             player (Actor): The player entity.
         """
+        self.player = player
         self.event_handler: EventHandler = MainGameEventHandler(self)
         self.message_log = MessageLog()
         self.mouse_location = (0,0)
-        self.player = player
+        self.ai_cost: Optional[np.ndarray] = None
+        self.ai_graph: Optional[tcod.path.SimpleGraph] = None
+        self.attack_queue: Dict[Actor, List[Actor]] = {}
+        self.fov_key: Optional[Tuple[GameMap, int, int, int]] = None
+        self.fov_window: Tuple[slice, slice] = (slice(0, 0), slice(0, 0))
+        self._player_pathfinder: Optional[tcod.path.Pathfinder] = None
+        self.hover_key: Optional[Tuple] = None
+        self.hover_names = ""
 
     def handle_enemy_turns(self) -> None:
         """
         Handle enemy turns.
 
         Loops through all entities on the map and handles their turns.
+        Enemies that are out of sight and have no path to follow are skipped,
+        as they would only wait. The attacks queued by the enemies are
+        resolved once they have all acted.
+        """
+        # The player has moved, so the distance map of the last turn is stale
+        self._player_pathfinder = None
+
+        game_map = self.game_map
+
+        # Gather the visibility of every enemy in one go from the position
+        # columns, rather than indexing the visible array once per enemy
+        in_view = game_map.visible[game_map.enemy_xs, game_map.enemy_ys]
+
+        for entity, seen in zip(game_map.enemy_actors, in_view.tolist()):
+            if not entity.ai:
+                continue
+            if not seen and not entity.ai.has_path:
+                continue  # A sleeping enemy would only wait.
+            entity.ai.perform()
+
+        self.resolve_attacks()
+
+    def queue_attack(self, attacker: Actor, target: Actor) -> None:
+        """
+        Queue an attack to be resolved at the end of the enemy turn.
+
+        Args:
+            attacker (Actor): The entity performing the attack.
+            target (Actor): The actor being attacked.
+        """
+        self.attack_queue.setdefault(target, []).append(attacker)
+
+    def resolve_attacks(self) -> None:
+        """
+        Resolve the queued attacks.
+
+        The attackers of each target attack it together, so the damage is
+        applied in one go with a single message for the group.
+        """
+        attack_queue, self.attack_queue = self.attack_queue, {}
+        for target, attackers in attack_queue.items():
+            perform_melee(self, attackers, target)
+
+    @property
+    def player_pathfinder(self) -> tcod.path.Pathfinder:
+        """
+        Get the distance map rooted at the player for this enemy turn.
+
+        Every enemy walks down the same distance map, so it is built once per
+        turn rather than once per enemy. It is only built when an enemy first
+        asks for a path to the player, so a turn in which nothing is chasing
+        the player does no pathfinding at all.
+
+        Returns:
+            tcod.path.Pathfinder: A pathfinder rooted at the player.
+        """
+        if self._player_pathfinder is None:
+            # A new pathfinder costs about 54 us, but one can't be reused by
+            # calling clear() and add_root(). In the tcod 16 this tree is
+            # written for, clear() replaces the travel array without updating
+            # the pointer the C search writes through, so paths from the
+            # reused pathfinder fail with an out of range index
+            pathfinder = tcod.path.Pathfinder(self.update_ai_cost())
+            pathfinder.add_root((self.player.x, self.player.y))
+            # The map is left unresolved, so that each path only resolves as
+            # far out from the player as the enemy asking for it
+            self._player_pathfinder = pathfinder
+
+        return self._player_pathfinder
+
+    def update_ai_cost(self) -> tcod.path.SimpleGraph:
+        """
+        Refill the movement cost grid shared by AI pathfinding.
+
+        The grid and its graph are allocated once per map and the grid is
+        refilled in place, rather than copied from the tiles by every AI that
+        needs a path.
+
+        Returns:
+            tcod.path.SimpleGraph: The graph over the refilled cost grid.
         """
-        for entity in set(self.game_map.actors) - {self.player}:
-            if entity.ai:
-                entity.ai.perform()
+        tiles = self.game_map.tiles
+        if (self.ai_graph is None or self.ai_cost is None
+                or self.ai_cost.shape != tiles.shape):
+            self.ai_cost = np.zeros(tiles.shape, dtype=np.int8, order="F")
+            # The graph keeps a reference to the cost grid, so refilling the
+            # grid in place is also seen by the graph
+            self.ai_graph = tcod.path.SimpleGraph(
+                cost=self.ai_cost, cardinal=2, diagonal=3)
+
+        cost = self.ai_cost
+        np.copyto(cost, self.game_map.walkable)
+
+        # Add to the cost of a blocked position
+        # A lower number means more enemies will crowd behind each other in
+        # hallways. a higher number means enemies will take longer paths in
+        # order to surround the player
+        blocker_xs, blocker_ys = self.game_map.blocker_locations
+        blocked = cost[blocker_xs, blocker_ys] != 0
+        cost[blocker_xs[blocked], blocker_ys[blocked]] += 10
+
+        return self.ai_graph
 
     def update_fov(self) -> None:
         """
         Update the FOV.
+
+        Only tiles within the FOV radius of the player can become visible, so
+        the FOV is computed over that window of the map alone. The window of
+        the previous update is cleared first, as nothing outside of it can
+        still be visible. Nothing is recomputed if neither the player nor the
+        tiles have changed since the last update.
         """
-        self.game_map.visible[:] = compute_fov(
-            self.game_map.tiles["transparent"],
-            (self.player.x, self.player.y),
-            radius=6
+        game_map = self.game_map
+        x, y = self.player.x, self.player.y
+        radius = 6
+
+        fov_key = (game_map, x, y, game_map.tile_version)
+        if fov_key == self.fov_key:
+            return
+        self.fov_key = fov_key
+
+        left, top = max(0, x - radius), max(0, y - radius)
+        window = (
+            slice(left, x + radius + 1),
+            slice(top, y + radius + 1),
+        )
+
+        game_map.visible[self.fov_window] = False
+        game_map.visible[window] = compute_fov(
+            game_map.transparent[window],
+            (x - left, y - top),
+            radius=radius
         )
+        self.fov_window = window
+
         # If a tile is visible it should be added to explored
-        self.game_map.explored |= self.game_map.visible
+        game_map.explored[window] |= game_map.visible[window]
 
     def render(self, console: Console) -> None:
         """
         Render the game.
 
-        Only displays entities that are in the FOV
+        Only displays entities that are in the FOV. The console does not need
+        to be cleared first.
 
         Args:
             console (Console): The console to render to.
@@ -75,7 +223,21 @@ class Engine:
         Returns:
             None
         """
-        self.game_map.render(console)
+        game_map = self.game_map
+        game_map.render(console)
+
+        # The map overwrites its whole area of the console every frame, so
+        # only the area around it needs clearing
+        console.draw_rect(
+            x=game_map.width, y=0, width=console.width - game_map.width,
+            height=game_map.height, ch=ord(" "), fg=(255, 255, 255),
+            bg=(0, 0, 0)
+        )
+        console.draw_rect(
+            x=0, y=game_map.height, width=console.width,
+            height=console.height - game_map.height, ch=ord(" "),
+            fg=(255, 255, 255), bg=(0, 0, 0)
+        )
 
         self.message_log.render(console=console, x=21, y=44, width=40, height=5)
 
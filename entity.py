@@ -26,6 +26,10 @@ class Entity:
         name: The name of the entity.
         blocks_movement: Whether the entity blocks movement.
     """
+    __slots__ = (
+        "game_map", "x", "y", "char", "color", "name", "blocks_movement",
+        "render_order",
+    )
 
     game_map: GameMap
 
@@ -60,13 +64,15 @@ class Entity:
         self.render_order = render_order
         if game_map:
             # If game_map isn't provided now then it will be set later.
-            self.game_map = game_map
-            game_map.entities.add(self)
+            game_map.add_entity(self)
 
     def spawn(self: T, gamemap: GameMap, x: int, y: int) -> T:
         """
         Spawn a copy of this entity at a given location.
 
+        The copy is shallow, so attributes are shared with this entity until
+        they are reassigned.
+
         Args:
             gamemap: The game map to spawn the entity on.
             x: The x-coordinate to spawn the entity at.
@@ -75,11 +81,10 @@ class Entity:
         Returns:
             Entity: The newly spawned entity.
         """
-        clone = copy.deepcopy(self)
+        clone = copy.copy(self)
         clone.x = x
         clone.y = y
-        clone.game_map = gamemap
-        gamemap.entities.add(clone)
+        gamemap.add_entity(clone)
 
         return clone
 
@@ -97,8 +102,10 @@ class Entity:
         Raises:
             None
         """
+        old_x, old_y = self.x, self.y
         self.x += dx
         self.y += dy
+        self.game_map.entity_moved(self, old_x, old_y)
 
     def place(self, x: int, y: int, game_map: Optional[GameMap] = None) -> None:
         """
@@ -109,13 +116,18 @@ class Entity:
             y: The y-coordinate to place the entity at.
             game_map: The game map to place the entity on.
         """
-        self.x = x
-        self.y = y
         if game_map:
             if hasattr(self, "game_map"):  # Possibly uninitialized.
-                self.game_map.entities.remove(self)
-            self.game_map = game_map
-            game_map.entities.add(self)
+                self.game_map.remove_entity(self)
+            self.x = x
+            self.y = y
+            game_map.add_entity(self)
+        else:
+            old_x, old_y = self.x, self.y
+            self.x = x
+            self.y = y
+            if hasattr(self, "game_map"):
+                self.game_map.entity_moved(self, old_x, old_y)
 
 
 class Actor(Entity):
@@ -126,6 +138,8 @@ class Actor(Entity):
         ai: The AI controlling the actor.
         fighter: The fighter component of the actor.
     """
+    __slots__ = ("ai", "fighter")
+
     def __init__(
             self,
             *,
@@ -164,6 +178,32 @@ class Actor(Entity):
         self.fighter = fighter
         self.fighter.entity = self
 
+    def spawn(self, gamemap: GameMap, x: int, y: int) -> Actor:
+        """
+        Spawn a copy of this actor at a given location.
+
+        Spawned actors are the enemies of the game map, so the copy is also
+        added to the enemies of `gamemap`. The player is placed, not spawned.
+        The copy gets its own fighter and a fresh AI, as those hold state.
+
+        Args:
+            gamemap: The game map to spawn the actor on.
+            x: The x-coordinate to spawn the actor at.
+            y: The y-coordinate to spawn the actor at.
+
+        Returns:
+            Actor: The newly spawned actor.
+        """
+        clone = super().spawn(gamemap, x, y)
+
+        clone.fighter = copy.copy(self.fighter)
+        clone.fighter.entity = clone
+        clone.ai = type(self.ai)(clone) if self.ai else None
+
+        gamemap.add_enemy(clone)
+
+        return clone
+
     @property
     def is_alive(self) -> bool:
         """
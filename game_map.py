@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import Iterable, Iterator, Optional, TYPE_CHECKING
+from typing import (
+    Dict, Iterable, Iterator, List, Optional, Tuple, TYPE_CHECKING
+)
 
 import numpy as np  # type: ignore
 from tcod.console import Console
@@ -13,6 +15,23 @@ if TYPE_CHECKING:
     from entity import Entity
 
 
+def _grown(column: np.ndarray, minimum: int = 16) -> np.ndarray:
+    """
+    Return a copy of a column buffer with twice the capacity.
+
+    Args:
+        column (np.ndarray): The buffer to grow.
+        minimum (int): The capacity of a buffer grown from empty.
+
+    Returns:
+        np.ndarray: The new buffer, starting with the rows of `column`.
+    """
+    grown = np.empty(
+        (max(2 * len(column), minimum),) + column.shape[1:], dtype=column.dtype)
+    grown[:len(column)] = column
+    return grown
+
+
 class GameMap:
     """
     Class to represent the game map
@@ -22,10 +41,43 @@ class GameMap:
         width (int): The width of the game map.
         height (int): The height of the game map.
         entities (set[Entity]): The entities on the game map.
+        entities_by_pos (Dict[Tuple[int, int], List[Entity]]): The entities on
+            the game map, bucketed by their location.
+        entity_xs (np.ndarray): The x-coordinates of the entities, one row
+            per entity.
+        entity_ys (np.ndarray): The y-coordinates of the entities.
+        entity_blocks (np.ndarray): Whether each entity blocks movement.
+        entity_render_orders (np.ndarray): The render order value of each
+            entity.
+        entity_chars (np.ndarray): The character code of each entity.
+        entity_colors (np.ndarray): The RGB colour of each entity.
+
+            The entity columns are views of buffers that double in size as
+            they fill, so adding an entity does not copy every column.
+        enemy_actors (List[Actor]): The living enemies on the game map.
+        enemy_xs (np.ndarray): The x-coordinates of `enemy_actors`, in the
+            same order.
+        enemy_ys (np.ndarray): The y-coordinates of `enemy_actors`, in the
+            same order.
         tiles (np.ndarray): The tiles of the game map.
         visible (np.ndarray): The visible tiles of the game map.
         explored (np.ndarray): The explored tiles of the game map.
+        tile_version (int): Bumped whenever the tiles are changed, so that
+            results computed from them can tell when they are stale.
+        entity_version (int): Bumped whenever an entity is added, removed,
+            moved or changed, in the same way as `tile_version`.
     """
+    __slots__ = (
+        "engine", "width", "height", "entities", "entities_by_pos",
+        "entity_xs", "entity_ys", "entity_blocks", "entity_render_orders",
+        "entity_chars", "entity_colors", "_entity_buffers", "_row_entities",
+        "_entity_rows", "enemy_actors", "enemy_xs", "enemy_ys",
+        "_enemy_buffers", "_enemy_index", "tiles",
+        "visible", "explored", "tile_version", "entity_version",
+        "_blocker_locations", "_render_order", "_walkable", "_transparent",
+        "_walkable_padded", "_tiles_light", "_tiles_dark", "_frame",
+        "_frame_visible", "_frame_explored",
+    )
 
     def __init__(self, engine: Engine, width: int, height: int,
                  entities: Iterable[Entity] = ()):
@@ -40,7 +92,26 @@ class GameMap:
         """
         self.engine = engine
         self.width, self.height = width, height
-        self.entities = set(entities)
+        self.entities: set[Entity] = set()
+        self.entities_by_pos: Dict[Tuple[int, int], List[Entity]] = {}
+        self._entity_buffers: List[np.ndarray] = [
+            np.empty(0, dtype=np.int32),  # x
+            np.empty(0, dtype=np.int32),  # y
+            np.empty(0, dtype=bool),  # blocks
+            np.empty(0, dtype=np.uint8),  # render order
+            np.empty(0, dtype=np.uint32),  # char
+            np.empty((0, 3), dtype=np.uint8),  # colour
+        ]
+        self._row_entities: List[Entity] = []
+        self._entity_rows: Dict[Entity, int] = {}
+        self._slice_entity_columns()
+        self.enemy_actors: List[Actor] = []
+        self._enemy_buffers: List[np.ndarray] = [
+            np.empty(0, dtype=np.int32),  # x
+            np.empty(0, dtype=np.int32),  # y
+        ]
+        self._enemy_index: Dict[Entity, int] = {}
+        self._slice_enemy_columns()
         self.tiles = np.full((width, height),
                              fill_value=tile_types.wall,
                              order="F")
@@ -50,6 +121,198 @@ class GameMap:
         self.explored = np.full((width, height),
                                 fill_value=False, order="F")
 
+        self.tile_version = 0
+        self.entity_version = 0
+
+        self._blocker_locations: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self._render_order: Optional[np.ndarray] = None
+        self._walkable: Optional[np.ndarray] = None
+        self._transparent: Optional[np.ndarray] = None
+        self._walkable_padded: Optional[np.ndarray] = None
+        self._tiles_light: Optional[np.ndarray] = None
+        self._tiles_dark: Optional[np.ndarray] = None
+        self._frame: Optional[np.ndarray] = None
+        self._frame_visible = np.empty_like(self.visible)
+        self._frame_explored = np.empty_like(self.explored)
+
+        for entity in entities:
+            self.add_entity(entity)
+
+    def add_entity(self, entity: Entity) -> None:
+        """
+        Add an entity to the game map at its current location.
+
+        Args:
+            entity (Entity): The entity to add.
+        """
+        entity.game_map = self
+        self.entities.add(entity)
+        self.entities_by_pos.setdefault((entity.x, entity.y), []).append(entity)
+
+        row = len(self._row_entities)
+        self._entity_rows[entity] = row
+        self._row_entities.append(entity)
+        if row == len(self._entity_buffers[0]):
+            self._entity_buffers = [
+                _grown(buffer) for buffer in self._entity_buffers
+            ]
+        self._slice_entity_columns()
+
+        self.entity_xs[row] = entity.x
+        self.entity_ys[row] = entity.y
+        self.entity_blocks[row] = entity.blocks_movement
+        self.entity_render_orders[row] = entity.render_order.value
+        self.entity_chars[row] = ord(entity.char)
+        self.entity_colors[row] = entity.color
+
+        self.mark_blockers_dirty()
+        self.mark_render_dirty()
+        self.entity_version += 1
+
+    def remove_entity(self, entity: Entity) -> None:
+        """
+        Remove an entity from the game map.
+
+        Args:
+            entity (Entity): The entity to remove.
+        """
+        self.entities.remove(entity)
+        self._remove_from_location(entity, entity.x, entity.y)
+
+        # Move the last entity into the freed row, rather than shifting
+        # every later row up by one
+        row = self._entity_rows.pop(entity)
+        last = self._row_entities.pop()
+        if last is not entity:
+            self._row_entities[row] = last
+            self._entity_rows[last] = row
+            for buffer in self._entity_buffers:
+                buffer[row] = buffer[len(self._row_entities)]
+        self._slice_entity_columns()
+
+        self.mark_blockers_dirty()
+        self.mark_render_dirty()
+        self.entity_version += 1
+
+    def entity_moved(self, entity: Entity, old_x: int, old_y: int) -> None:
+        """
+        Update the location buckets after an entity has moved.
+
+        Args:
+            entity (Entity): The entity that moved.
+            old_x (int): The x-coordinate the entity moved from.
+            old_y (int): The y-coordinate the entity moved from.
+        """
+        self._remove_from_location(entity, old_x, old_y)
+        self.entities_by_pos.setdefault((entity.x, entity.y), []).append(entity)
+        if entity.blocks_movement:
+            self.mark_blockers_dirty()
+
+        row = self._entity_rows[entity]
+        self.entity_xs[row] = entity.x
+        self.entity_ys[row] = entity.y
+
+        index = self._enemy_index.get(entity)
+        if index is not None:
+            self.enemy_xs[index] = entity.x
+            self.enemy_ys[index] = entity.y
+
+        self.entity_version += 1
+
+    def entity_changed(self, entity: Entity) -> None:
+        """
+        Update the columns of an entity after its appearance or blocking has
+        changed, such as when an actor dies.
+
+        Whatever sets the character, colour, name, blocking or render order
+        of an entity on the map must call this once afterwards, as
+        `Fighter.die` does.
+
+        Args:
+            entity (Entity): The entity that changed.
+        """
+        row = self._entity_rows[entity]
+        self.entity_blocks[row] = entity.blocks_movement
+        self.entity_render_orders[row] = entity.render_order.value
+        self.entity_chars[row] = ord(entity.char)
+        self.entity_colors[row] = entity.color
+
+        self.mark_blockers_dirty()
+        self.mark_render_dirty()
+        self.entity_version += 1
+
+    def add_enemy(self, actor: Actor) -> None:
+        """
+        Add an actor to the living enemies of the game map.
+
+        Args:
+            actor (Actor): The enemy to add.
+        """
+        index = len(self.enemy_actors)
+        self._enemy_index[actor] = index
+        self.enemy_actors.append(actor)
+        if index == len(self._enemy_buffers[0]):
+            self._enemy_buffers = [
+                _grown(buffer) for buffer in self._enemy_buffers
+            ]
+        self._slice_enemy_columns()
+
+        self.enemy_xs[index] = actor.x
+        self.enemy_ys[index] = actor.y
+
+    def remove_enemy(self, actor: Actor) -> None:
+        """
+        Remove an actor from the living enemies of the game map.
+
+        Args:
+            actor (Actor): The enemy to remove.
+        """
+        # Move the last enemy into the freed place, as for entity rows
+        index = self._enemy_index.pop(actor)
+        last = self.enemy_actors.pop()
+        if last is not actor:
+            self.enemy_actors[index] = last
+            self._enemy_index[last] = index
+            for buffer in self._enemy_buffers:
+                buffer[index] = buffer[len(self.enemy_actors)]
+        self._slice_enemy_columns()
+
+    def _slice_entity_columns(self) -> None:
+        """
+        Point the entity columns at the rows of the buffers in use.
+        """
+        count = len(self._row_entities)
+        (
+            self.entity_xs, self.entity_ys, self.entity_blocks,
+            self.entity_render_orders, self.entity_chars, self.entity_colors,
+        ) = (buffer[:count] for buffer in self._entity_buffers)
+
+    def _slice_enemy_columns(self) -> None:
+        """
+        Point the enemy columns at the rows of the buffers in use.
+        """
+        count = len(self.enemy_actors)
+        self.enemy_xs, self.enemy_ys = (
+            buffer[:count] for buffer in self._enemy_buffers
+        )
+
+    def _remove_from_location(self, entity: Entity, x: int, y: int) -> None:
+        """
+        Remove an entity from the bucket of a location.
+
+        Empty buckets are dropped so the dictionary only holds occupied
+        locations.
+
+        Args:
+            entity (Entity): The entity to remove.
+            x (int): The x-coordinate of the bucket.
+            y (int): The y-coordinate of the bucket.
+        """
+        bucket = self.entities_by_pos[x, y]
+        bucket.remove(entity)
+        if not bucket:
+            del self.entities_by_pos[x, y]
+
     @property
     def actors(self) -> Iterator[Actor]:
         """
@@ -64,6 +327,152 @@ class GameMap:
             if isinstance(entity, Actor) and entity.is_alive
         )
 
+    @property
+    def blocker_locations(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the locations of the entities that block movement.
+
+        The locations are kept as parallel x and y arrays so they can be used
+        for fancy indexing. They are only rebuilt after `mark_blockers_dirty`
+        has been called.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The x and y coordinates.
+        """
+        if self._blocker_locations is None:
+            blocks = self.entity_blocks
+            self._blocker_locations = (
+                self.entity_xs[blocks], self.entity_ys[blocks]
+            )
+
+        return self._blocker_locations
+
+    def mark_blockers_dirty(self) -> None:
+        """
+        Mark the blocker locations as stale.
+
+        Called whenever an entity that may block movement is added, removed,
+        moves or dies.
+        """
+        self._blocker_locations = None
+
+    @property
+    def render_sorted_rows(self) -> np.ndarray:
+        """
+        Get the entity rows sorted by render order.
+
+        Only re-sorted after `mark_render_dirty` has been called.
+
+        Returns:
+            np.ndarray: The entity rows, lowest render order first.
+        """
+        if self._render_order is None:
+            self._render_order = np.argsort(
+                self.entity_render_orders, kind="stable")
+
+        return self._render_order
+
+    def mark_render_dirty(self) -> None:
+        """
+        Mark the render order of the entities as stale.
+
+        Called whenever an entity is added or removed, or its render order
+        changes.
+        """
+        self._render_order = None
+
+    @property
+    def walkable(self) -> np.ndarray:
+        """
+        Get the walkable flags of the tiles, as a contiguous array.
+
+        Rebuilt after `mark_tiles_dirty` has been called.
+
+        Returns:
+            np.ndarray: The walkable tiles.
+        """
+        if self._walkable is None:
+            self._walkable = np.asfortranarray(self.tiles["walkable"])
+
+        return self._walkable
+
+    @property
+    def transparent(self) -> np.ndarray:
+        """
+        Get the transparent flags of the tiles, as a contiguous array.
+
+        Rebuilt after `mark_tiles_dirty` has been called.
+
+        Returns:
+            np.ndarray: The transparent tiles.
+        """
+        if self._transparent is None:
+            self._transparent = np.asfortranarray(self.tiles["transparent"])
+
+        return self._transparent
+
+    @property
+    def walkable_padded(self) -> np.ndarray:
+        """
+        Get the walkable tiles surrounded by a one tile unwalkable border.
+
+        Index with `[x + 1, y + 1]`. Any location one step outside the map
+        lands on the border, so a single read covers both the bounds check and
+        the walkable check. Rebuilt after `mark_tiles_dirty` has been called.
+
+        Returns:
+            np.ndarray: The padded walkable array.
+        """
+        if self._walkable_padded is None:
+            self._walkable_padded = np.pad(self.walkable, 1)
+
+        return self._walkable_padded
+
+    @property
+    def tiles_light(self) -> np.ndarray:
+        """
+        Get the graphics of the tiles when in FOV, as a contiguous array.
+
+        Reading the `light` field of the tiles directly strides over the
+        whole tile record. Rebuilt after `mark_tiles_dirty` has been called.
+
+        Returns:
+            np.ndarray: The light graphics of the tiles.
+        """
+        if self._tiles_light is None:
+            self._tiles_light = np.asfortranarray(self.tiles["light"])
+
+        return self._tiles_light
+
+    @property
+    def tiles_dark(self) -> np.ndarray:
+        """
+        Get the graphics of the tiles when not in FOV, as a contiguous array.
+
+        Rebuilt after `mark_tiles_dirty` has been called.
+
+        Returns:
+            np.ndarray: The dark graphics of the tiles.
+        """
+        if self._tiles_dark is None:
+            self._tiles_dark = np.asfortranarray(self.tiles["dark"])
+
+        return self._tiles_dark
+
+    def mark_tiles_dirty(self) -> None:
+        """
+        Mark the arrays derived from the tiles as stale.
+
+        Called whenever the tiles of the game map are changed.
+        """
+        self.tile_version += 1
+        self._walkable = None
+        self._transparent = None
+        self._walkable_padded = None
+        self._tiles_light = None
+        self._tiles_dark = None
+        self._frame = None
+
     def get_blocking_entity_at_location(
             self,
             location_x: int,
@@ -79,10 +488,8 @@ class GameMap:
         Returns:
             Optional[Entity]: The blocking entity at the location.
         """
-        for entity in self.entities:
-            if (entity.blocks_movement
-                    and entity.x == location_x
-                    and entity.y == location_y):
+        for entity in self.entities_by_pos.get((location_x, location_y), ()):
+            if entity.blocks_movement:
                 return entity
 
         return None
@@ -98,9 +505,9 @@ class GameMap:
         Returns:
             Optional[Actor]: The actor at the location.
         """
-        for actor in self.actors:
-            if actor.x == x and actor.y == y:
-                return actor
+        for entity in self.entities_by_pos.get((x, y), ()):
+            if isinstance(entity, Actor) and entity.is_alive:
+                return entity
 
         return None
 
@@ -117,6 +524,49 @@ class GameMap:
         """
         return 0 <= x < self.width and 0 <= y < self.height
 
+    def update_frame(self, dtype: np.dtype) -> np.ndarray:
+        """
+        Bring the cached tile graphics of the map up to date.
+
+        The whole frame is only built on the first render and after
+        `mark_tiles_dirty` has been called. After that, only the tiles whose
+        visible or explored state changed since the last render are redrawn.
+
+        Args:
+            dtype (np.dtype): The graphics dtype of the console being drawn
+                to, so the frame can be copied over as raw bytes.
+
+        Returns:
+            np.ndarray: The tile graphics of the whole map.
+        """
+        if self._frame is None or self._frame.dtype != dtype:
+            self._frame = np.empty(
+                (self.width, self.height), dtype=dtype, order="F")
+            self._frame[...] = np.select(
+                condlist=[self.visible, self.explored],
+                choicelist=[self.tiles_light, self.tiles_dark],
+                default=tile_types.SHROUD
+            )
+            np.copyto(self._frame_visible, self.visible)
+            np.copyto(self._frame_explored, self.explored)
+            return self._frame
+
+        changed = self.visible != self._frame_visible
+        changed |= self.explored != self._frame_explored
+        xs, ys = np.nonzero(changed)
+        if len(xs):
+            visible = self.visible[xs, ys]
+            explored = self.explored[xs, ys]
+            self._frame[xs, ys] = np.where(
+                visible,
+                self.tiles_light[xs, ys],
+                np.where(explored, self.tiles_dark[xs, ys], tile_types.SHROUD)
+            )
+            self._frame_visible[xs, ys] = visible
+            self._frame_explored[xs, ys] = explored
+
+        return self._frame
+
     def render(self, console: Console) -> None:
         """
         Renders the game
@@ -128,19 +578,30 @@ class GameMap:
         Args:
             console (Console): The console to render to
         """
-        console.rgb[0: self.width, 0: self.height] = np.select(
-            condlist=[self.visible, self.explored],
-            choicelist=[self.tiles["light"], self.tiles["dark"]],
-            default=tile_types.SHROUD
-        )
+        frame = self.update_frame(console.rgb.dtype)
+        window = console.rgb[0: self.width, 0: self.height]
+        if window.flags.f_contiguous:
+            # Copy the frame over as raw bytes, which is a single memcpy
+            # rather than a field by field copy of the structured dtype
+            raw = np.dtype((np.void, frame.dtype.itemsize))
+            np.copyto(window.view(raw), frame.view(raw))
+        else:
+            window[...] = frame
 
-        entities_sorted_for_rendering = sorted(
-            self.entities, key=lambda x: x.render_order.value
-        )
+        # Entities later in render order overwrite the ones below them
+        order = self.render_sorted_rows
+        xs, ys = self.entity_xs[order], self.entity_ys[order]
+        in_view = self.visible[xs, ys]
+        order, xs, ys = order[in_view], xs[in_view], ys[in_view]
+
+        # Keep only the top entity of each tile, the last one of its cell in
+        # render order, as NumPy does not say which of several writes to the
+        # same index wins
+        cells = xs * self.height + ys
+        _, top = np.unique(cells[::-1], return_index=True)
+        top = len(cells) - 1 - top
+        order, xs, ys = order[top], xs[top], ys[top]
 
-        # Draw all entities in the game map
-        for entity in entities_sorted_for_rendering:
-            if self.visible[entity.x, entity.y]:
-                console.print(
-                    x=entity.x, y=entity.y, string=entity.char, fg=entity.color
-                )
+        # Draw all visible entities in the game map in one go
+        console.ch[xs, ys] = self.entity_chars[order]
+        console.fg[xs, ys] = self.entity_colors[order]
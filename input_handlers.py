@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Optional, TYPE_CHECKING, override
+from typing import Dict, Optional, Tuple, TYPE_CHECKING, override
 
 import tcod.event
 from tcod import constants
@@ -73,8 +73,11 @@ class EventHandler(tcod.event.EventDispatch[Action]):
 
     @override
     def ev_mousemotion(self, event: tcod.event.MouseMotion) -> None:
-        if self.engine.game_map.in_bounds(event.tile.x, event.tile.y):
-            self.engine.mouse_location = event.tile.x, event.tile.y
+        x, y = event.tile.x, event.tile.y
+        if (x, y) == self.engine.mouse_location:
+            return  # Still over the same tile.
+        if self.engine.game_map.in_bounds(x, y):
+            self.engine.mouse_location = x, y
 
     def ev_quit(self, event: tcod.event.Quit) -> Optional[Action]:
         """
@@ -105,7 +108,31 @@ class EventHandler(tcod.event.EventDispatch[Action]):
 class MainGameEventHandler(EventHandler):
     """
     The main game event handler.
+
+    Attributes:
+        key_actions (Dict[tcod.event.KeySym, Action]): The player's action
+            for each movement, wait and escape key, built once so that a key
+            press is a single lookup rather than a new action.
     """
+    def __init__(self, engine: Engine):
+        """
+        The constructor for the main game event handler.
+
+        Args:
+            engine (Engine): The game engine.
+        """
+        super().__init__(engine)
+
+        player = engine.player
+        self.key_actions: Dict[tcod.event.KeySym, Action] = {
+            key: BumpAction(player, dx, dy)
+            for key, (dx, dy) in MOVE_KEYS.items()
+        }
+        wait_action = WaitAction(player)
+        for key in WAIT_KEYS:
+            self.key_actions[key] = wait_action
+        self.key_actions[tcod.event.KeySym.ESCAPE] = EscapeAction(player)
+
     @override
     def handle_events(self, context: tcod.context.Context) -> None:
         """
@@ -150,21 +177,12 @@ class MainGameEventHandler(EventHandler):
         Returns:
             Optional[Action]: The action to be taken.
         """
-        action: Optional[Action] = None
-
         key = event.sym
 
-        player = self.engine.player
+        action = self.key_actions.get(key)
 
-        if key in MOVE_KEYS:
-            dx, dy = MOVE_KEYS[key]
-            action = BumpAction(player, dx, dy)
-        elif key in WAIT_KEYS:
-            action = WaitAction(player)
-        elif key == tcod.event.KeySym.ESCAPE:
-            action = EscapeAction(player)
-        elif key == tcod.event.KeySym.v:
-            self.engine.event_handler = HistoryViewer(self.engine)
+        if action is None and key == tcod.event.KeySym.v:
+            self.engine.event_handler = HistoryViewer(self.engine, self)
 
         return action
 
@@ -212,19 +230,30 @@ class HistoryViewer(EventHandler):
     Prints the history on a larger window which can be navigated.
 
     Attributes:
+        parent (EventHandler): The handler to return to when the viewer
+            is closed.
         log_length (int): The length of the message log.
         cursor (int): The current position of the cursor.
+        log_console (Optional[tcod.console.Console]): The drawn history
+            window, redrawn only when the cursor or console size changes.
+        log_console_key (Optional[Tuple[int, int, int]]): The cursor and
+            console size that `log_console` was drawn for.
     """
-    def __init__(self, engine: Engine):
+    def __init__(self, engine: Engine, parent: EventHandler):
         """
         Initialises the history viewer.
 
         Args:
             engine (Engine): The game engine
+            parent (EventHandler): The handler to return to when the viewer
+                is closed.
         """
         super().__init__(engine)
+        self.parent = parent
         self.log_length = len(engine.message_log.messages)
         self.cursor = self.log_length - 1
+        self.log_console: Optional[tcod.console.Console] = None
+        self.log_console_key: Optional[Tuple[int, int, int]] = None
 
     @override
     def on_render(self, console: tcod.Console) -> None:
@@ -236,8 +265,38 @@ class HistoryViewer(EventHandler):
         """
         super().on_render(console)
 
-        log_console = (
-            tcod.console.Console(console.width - 6, console.height - 6))
+        # Only redraw the window when the cursor or console size has changed
+        log_console_key = (self.cursor, console.width, console.height)
+        if log_console_key != self.log_console_key:
+            if (self.log_console_key is None
+                    or log_console_key[1:] != self.log_console_key[1:]):
+                self.log_console = None  # The window has to be resized.
+            self.log_console = self.draw_log_console(console)
+            self.log_console_key = log_console_key
+
+        self.log_console.blit(console, 3, 3)
+
+    def draw_log_console(
+            self,
+            console: tcod.Console
+    ) -> tcod.console.Console:
+        """
+        Draws the history window at the current cursor.
+
+        The window from the last draw is cleared and reused, if there is one.
+
+        Args:
+            console: The console the window will be blitted to.
+
+        Returns:
+            tcod.console.Console: The drawn history window.
+        """
+        log_console = self.log_console
+        if log_console is None:
+            log_console = (
+                tcod.console.Console(console.width - 6, console.height - 6))
+        else:
+            log_console.clear()
 
         # Draw a frame with a custom banner title.
         log_console.draw_frame(0, 0, log_console.width, log_console.height)
@@ -247,15 +306,17 @@ class HistoryViewer(EventHandler):
         )
 
         # Render the message log using the cursor parameter.
-        self.engine.message_log.render_messages(
+        message_log = self.engine.message_log
+        message_log.render_messages(
             log_console,
             1,
             1,
             log_console.width - 2,
             log_console.height - 2,
-            self.engine.message_log.messages[: self.cursor + 1],
+            message_log.messages,
+            end=self.cursor + 1,
         )
-        log_console.blit(console, 3, 3)
+        return log_console
 
     @override
     def ev_keydown(self, event: tcod.event.KeyDown) -> None:
@@ -285,5 +346,6 @@ class HistoryViewer(EventHandler):
             # Move directly to the last message.
             self.cursor = self.log_length - 1
         else:
-            # Any other key moves back to the main game state.
-            self.engine.event_handler = MainGameEventHandler(self.engine)
+            # Any other key moves back to the main game state. The handler
+            # it came from is reused, along with its pre-built actions.
+            self.engine.event_handler = self.parent
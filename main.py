@@ -66,7 +66,6 @@ def main():
 
         # Game loop
         while True:
-            root_console.clear()
             engine.event_handler.on_render(console=root_console)
             context.present(root_console)
 
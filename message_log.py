@@ -1,4 +1,4 @@
-from typing import List, Reversible, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 import textwrap
 
 import tcod
@@ -26,6 +26,8 @@ class Message:
         self.plain_text = text
         self.fg = fg
         self.count = 1
+        self._wrapped: Dict[int, List[str]] = {}
+        self._wrapped_count = 1
 
     @property
     def full_text(self) -> str:
@@ -39,6 +41,28 @@ class Message:
             return f"{self.plain_text} (x{self.count})"
         return self.plain_text
 
+    def wrapped(self, width: int) -> List[str]:
+        """
+        The full text of this message, wrapped to the given width.
+
+        The lines are cached for each width, until the count changes.
+
+        Args:
+            width (int): The width to wrap the text to.
+
+        Returns:
+            List[str]: The wrapped lines of this message.
+        """
+        if self._wrapped_count != self.count:
+            self._wrapped.clear()
+            self._wrapped_count = self.count
+
+        lines = self._wrapped.get(width)
+        if lines is None:
+            lines = self._wrapped[width] = textwrap.wrap(self.full_text, width)
+
+        return lines
+
 
 class MessageLog:
     """
@@ -105,13 +129,15 @@ class MessageLog:
             y: int,
             width: int,
             height: int,
-            messages: Reversible[Message],
+            messages: Sequence[Message],
+            end: Optional[int] = None,
     ) -> None:
         """
         Render the messages provided.
 
         The `messages` are rendered starting at the last message and working
-        backwards.
+        backwards. If `end` is given, rendering starts just before it
+        instead, without slicing the messages.
 
         Args:
             console (tcod.Console): The console to render to.
@@ -119,12 +145,18 @@ class MessageLog:
             y (int): The y position to start rendering at.
             width (int): The width of the area to render to.
             height (int): The height of the area to render to.
-            messages (Reversible[Message]): The messages to render.
+            messages (Sequence[Message]): The messages to render.
+            end (Optional[int], optional): The index after the last message to
+                render. Defaults to the end of `messages`.
         """
         y_offset = height - 1
 
-        for message in reversed(messages):
-            for line in reversed(textwrap.wrap(message.full_text, width)):
+        if end is None:
+            end = len(messages)
+
+        for index in range(end - 1, -1, -1):
+            message = messages[index]
+            for line in reversed(message.wrapped(width)):
                 console.print(x=x, y=y + y_offset, string=line, fg=message.fg)
                 y_offset -= 1
                 if y_offset < 0:
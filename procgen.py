@@ -14,9 +14,9 @@ Classes:
 from __future__ import annotations
 
 import random
-from typing import Iterator, List, Tuple, TYPE_CHECKING
+from typing import List, Tuple, TYPE_CHECKING
 
-import tcod
+import numpy as np  # type: ignore
 
 import entity_factories
 from game_map import GameMap
@@ -35,6 +35,10 @@ class RectangularRoom:
         y1 (int): The y coordinate of the top left corner of the room.
         x2 (int): The x coordinate of the bottom right corner of the room.
         y2 (int): The y coordinate of the bottom right corner of the room.
+        centre (Tuple[int, int]): The x, y coordinates of the centre of the
+            room.
+        inner (Tuple[slice, slice]): The inner area of the room as a tuple of
+            slices.
     """
 
     def __init__(self, x: int, y: int, width: int, height: int):
@@ -42,7 +46,7 @@ class RectangularRoom:
         Initialize a new room.
 
         Takes the coordinates of the top left corner, and computes the bottom
-        right corner.
+        right corner, the centre and the inner area.
 
         Args:
             x (int): The x coordinate of the room.
@@ -55,29 +59,9 @@ class RectangularRoom:
         self.x2 = x + width
         self.y2 = y + height
 
-    @property
-    def centre(self) -> Tuple[int, int]:
-        """
-        Get the centre of the room.
-
-        Returns:
-            Tuple[int, int]: The x, y coordinates of the centre of the room.
-        """
-        centre_x = int((self.x1 + self.x2) / 2)
-        centre_y = int((self.y1 + self.y2) / 2)
-
-        return centre_x, centre_y
-
-    @property
-    def inner(self) -> Tuple[slice, slice]:
-        """
-        Get the inner area of the room.
-
-        Returns:
-            Tuple[slice, slice]: The inner area of the room as a tuple of
-            slices.
-        """
-        return slice(self.x1 + 1, self.x2), slice(self.y1 + 1, self.y2)
+        # Rooms never move, so these are only worked out once
+        self.centre = (self.x1 + self.x2) // 2, (self.y1 + self.y2) // 2
+        self.inner = slice(self.x1 + 1, self.x2), slice(self.y1 + 1, self.y2)
 
     def intersects(self, other: RectangularRoom) -> bool:
         """
@@ -101,6 +85,7 @@ def place_entities(
         room: RectangularRoom,
         dungeon: GameMap,
         maximum_monsters: int,
+        rand: random.Random,
 ) -> None:
     """
     Place entities in a room.
@@ -109,16 +94,17 @@ def place_entities(
         room (RectangularRoom): The room to place the entities in.
         dungeon (GameMap): The dungeon map.
         maximum_monsters (int): The maximum number of monsters to place.
+        rand (random.Random): The random number generator to draw from.
     """
-    number_of_monsters = random.randint(0, maximum_monsters)
+    randint = rand.randint
+    number_of_monsters = randint(0, maximum_monsters)
 
     for _ in range(number_of_monsters):
-        x = random.randint(room.x1 + 1, room.x2 - 1)
-        y = random.randint(room.y1 + 1, room.y2 - 1)
+        x = randint(room.x1 + 1, room.x2 - 1)
+        y = randint(room.y1 + 1, room.y2 - 1)
 
-        if not any(
-                entity.x == x and entity.y == y for entity in dungeon.entities):
-            if random.random() < 0.8:
+        if (x, y) not in dungeon.entities_by_pos:
+            if rand.random() < 0.8:
                 entity_factories.orc.spawn(dungeon, x, y)
             else:
                 entity_factories.troll.spawn(dungeon, x, y)
@@ -126,36 +112,42 @@ def place_entities(
 
 def tunnel_between(
         start: Tuple[int, int],
-        end: Tuple[int, int]
-) -> Iterator[Tuple[int, int]]:
+        end: Tuple[int, int],
+        rand: random.Random,
+) -> Tuple[np.ndarray, np.ndarray]:
     """
     Create a tunnel between two points.
 
-    Uses Bresenham's line algorithm to create a tunnel between two points.
+    The tunnel is an L-shape made of one horizontal and one vertical leg,
+    turning at a randomly chosen corner.
 
     Args:
         start (Tuple[int, int]): The x, y coordinates of the start point.
         end (Tuple[int, int]): The x, y coordinates of the end point.
+        rand (random.Random): The random number generator to draw from.
 
-    Yields:
-        Tuple[int, int]: The x, y coordinates of the next point in the tunnel.
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The x and y coordinates of the tunnel,
+        ready to be used as a fancy index.
     """
     x1, y1 = start
     x2, y2 = end
 
-    if random.random() < 0.5:
-        corner_x, corner_y = x2, y1
+    if rand.random() < 0.5:
+        # Go along x first, turning at (x2, y1)
+        leg_y, leg_x = y1, x2
     else:
-        corner_x, corner_y = x1, y2
+        # Go along y first, turning at (x1, y2)
+        leg_y, leg_x = y2, x1
 
-    # Generate the coordinates for the tunnel
-    for x, y in tcod.los.bresenham((x1, y1),
-                                   (corner_x, corner_y)).tolist():
-        yield x, y
+    # Both legs are axis aligned, so they are plain ranges
+    xs = np.arange(min(x1, x2), max(x1, x2) + 1)
+    ys = np.arange(min(y1, y2), max(y1, y2) + 1)
 
-    for x, y in tcod.los.bresenham((corner_x, corner_y),
-                                   (x2, y2)).tolist():
-        yield x, y
+    return (
+        np.concatenate((xs, np.full(len(ys), leg_x))),
+        np.concatenate((np.full(len(xs), leg_y), ys)),
+    )
 
 
 def generate_dungeon(
@@ -187,13 +179,22 @@ def generate_dungeon(
 
     rooms: List[RectangularRoom] = []
 
-    for r in range(max_rooms):
-        room_width = random.randint(room_min_size, room_max_size)
-        room_height = random.randint(room_min_size, room_max_size)
-
-        x = random.randint(0, dungeon.width - room_width - 1)
-        y = random.randint(0, dungeon.height - room_height - 1)
-
+    # Draw the size and position of every room up front, one batch per
+    # value. Both generators are seeded from `random`, so seeding `random`
+    # still makes the dungeon repeatable, while the rest of the generation
+    # draws from a local instance rather than the module-level functions
+    rng = np.random.default_rng(random.getrandbits(64))
+    rand = random.Random(random.getrandbits(64))
+    room_widths = rng.integers(
+        room_min_size, room_max_size, size=max_rooms, endpoint=True)
+    room_heights = rng.integers(
+        room_min_size, room_max_size, size=max_rooms, endpoint=True)
+    room_xs = rng.integers(0, dungeon.width - room_widths - 1, endpoint=True)
+    room_ys = rng.integers(0, dungeon.height - room_heights - 1, endpoint=True)
+
+    for room_width, room_height, x, y in zip(
+            room_widths.tolist(), room_heights.tolist(),
+            room_xs.tolist(), room_ys.tolist()):
         new_room = RectangularRoom(x, y, room_width, room_height)
 
         # Run through the other rooms and see if they intersect with this one
@@ -208,11 +209,14 @@ def generate_dungeon(
             player.place(*new_room.centre, dungeon)
         else:
             # Dig out a tunnel between this room and the previous one
-            for x, y in tunnel_between(rooms[-1].centre, new_room.centre):
-                dungeon.tiles[x, y] = tile_types.floor
+            tunnel = tunnel_between(
+                rooms[-1].centre, new_room.centre, rand)
+            dungeon.tiles[tunnel] = tile_types.floor
 
-        place_entities(new_room, dungeon, max_monsters_per_room)
+        place_entities(new_room, dungeon, max_monsters_per_room, rand)
 
         rooms.append(new_room)
 
+    dungeon.mark_tiles_dirty()
+
     return dungeon
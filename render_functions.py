@@ -25,8 +25,7 @@ def get_names_at_location(x: int, y: int, game_map: GameMap) -> str:
         return ""
 
     names = ", ".join(
-        entity.name for entity in game_map.entities if entity.x == x and
-        entity.y == y
+        entity.name for entity in game_map.entities_by_pos.get((x, y), ())
     )
 
     return names.capitalize()
@@ -47,18 +46,20 @@ def render_bar(
         maximum_value (int): The maximum value of the bar.
         total_width (int): The total width of the bar.
     """
-    bar_width = int(float(current_value) / maximum_value * total_width)
+    bar_width = current_value * total_width // maximum_value
+    bar_width = min(max(bar_width, 0), total_width)
 
-    # Render the background first
-    console.draw_rect(
-        x=0, y=44, width=total_width, height=1, ch=1, bg=colour.bar_empty
-    )
-
-    # Render the filled bar on top
+    # Render the filled and empty parts of the bar side by side, so that no
+    # cell is drawn twice
     if bar_width > 0:
         console.draw_rect(
             x=0, y=44, width=bar_width, height=1, ch=1, bg=colour.bar_filled
         )
+    if bar_width < total_width:
+        console.draw_rect(
+            x=bar_width, y=44, width=total_width - bar_width, height=1, ch=1,
+            bg=colour.bar_empty
+        )
 
     console.print(
         x=1, y=44, string=f'HP: {current_value}/{maximum_value}',
@@ -75,16 +76,26 @@ def render_names_at_mouse_location(
     """
     Render the names of entities at the player's mouse location.
 
+    The names are only looked up again when the mouse, the entities or the
+    player's view have changed since the last frame.
+
     Args:
         console (Console): The console to render the names to.
         x (int): The x-coordinate to render the names to.
         y (int): The y-coordinate to render the names to.
         engine (Engine): The game engine.
     """
-    mouse_x, mouse_y = engine.mouse_location
-
-    names_at_mouse_location = get_names_at_location(
-        x=mouse_x, y=mouse_y, game_map=engine.game_map
+    game_map = engine.game_map
+    hover_key = (
+        engine.mouse_location, game_map, game_map.entity_version,
+        engine.fov_key
     )
 
-    console.print(x=x, y=y, string=names_at_mouse_location)
+    if hover_key != engine.hover_key:
+        mouse_x, mouse_y = engine.mouse_location
+        engine.hover_names = get_names_at_location(
+            x=mouse_x, y=mouse_y, game_map=game_map
+        )
+        engine.hover_key = hover_key
+
+    console.print(x=x, y=y, string=engine.hover_names)